@@ -10,8 +10,17 @@ from .srt import SRT
 from .hrrn import HRRN
 from .feedback import FB1, FB2i
 from .aging import Aging
+from .run_queue import RunQueueScheduler
+from .cfs import CFS
+from .edf import EDF
+from .stride import Stride
+from .adaptive import QuantumController, AdaptiveRoundRobin, AdaptiveAging
+from .sharded import ShardedScheduler
+from .batched import BatchResult, simulate_batch
 
 __all__ = [
     'SchedulerBase', 'FCFS', 'RoundRobin', 'SPN', 'SRT', 
-    'HRRN', 'FB1', 'FB2i', 'Aging'
+    'HRRN', 'FB1', 'FB2i', 'Aging', 'RunQueueScheduler', 'CFS', 'EDF',
+    'Stride', 'QuantumController', 'AdaptiveRoundRobin', 'AdaptiveAging',
+    'ShardedScheduler', 'BatchResult', 'simulate_batch'
 ]
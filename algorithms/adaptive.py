@@ -0,0 +1,71 @@
+"""
+Adaptive-quantum variants of Round Robin and Aging.
+"""
+
+import math
+from collections import deque
+from .round_robin import RoundRobin
+from .aging import Aging
+
+
+class QuantumController:
+    """
+    Picks a time quantum online from recently observed CPU bursts.
+    The quantum is the target percentile of the last `window` completed
+    burst lengths, so that about that fraction of bursts finish within a
+    single quantum (the classic rule of thumb is 80%).
+    """
+
+    def __init__(self, percentile=0.8, window=16, initial=1):
+        """
+        Args:
+            percentile: Fraction of recent bursts that should fit in one quantum
+            window: Number of recent bursts remembered
+            initial: Quantum used until the first burst completes
+        """
+        if not 0 < percentile <= 1:
+            raise ValueError(f"Quantum percentile must be in (0, 1]: {percentile}")
+        if window < 1 or initial < 1:
+            raise ValueError("Quantum window and initial quantum must be positive")
+        self.percentile = percentile
+        self.recent = deque(maxlen=window)
+        self.quantum = initial
+
+    def observe(self, burst_length: int) -> int:
+        """Record a completed CPU burst and return the updated quantum."""
+        self.recent.append(burst_length)
+        ordered = sorted(self.recent)
+        rank = max(1, math.ceil(self.percentile * len(ordered)))
+        self.quantum = max(1, ordered[rank - 1])
+        return self.quantum
+
+
+class AdaptiveQuantumMixin:
+    """
+    Replaces a scheduler's fixed quantum with a QuantumController.
+    The controller sees every completed CPU burst; the scheduler reads the new
+    quantum at its next decision. Every change is recorded as (time, quantum)
+    in state.quantum_trajectory.
+    """
+
+    def __init__(self, processes, last_instant, output_formatter, percentile=0.8,
+                 window=16, initial_quantum=1, **kwargs):
+        self.controller = QuantumController(percentile, window, initial_quantum)
+        super().__init__(processes, last_instant, output_formatter, self.controller.quantum, **kwargs)
+        self.state.quantum_trajectory.append((0, self.quantum))
+
+    def _complete_burst(self, process, current_time):
+        length = process.cpu_bursts[self.state.burst_index[process.pid]]
+        quantum = self.controller.observe(length)
+        if quantum != self.quantum:
+            self.quantum = quantum
+            self.state.quantum_trajectory.append((current_time, quantum))
+        return super()._complete_burst(process, current_time)
+
+
+class AdaptiveRoundRobin(AdaptiveQuantumMixin, RoundRobin):
+    """Round Robin whose quantum follows the target percentile of recent bursts."""
+
+
+class AdaptiveAging(AdaptiveQuantumMixin, Aging):
+    """Aging whose quantum follows the target percentile of recent bursts."""
@@ -2,6 +2,7 @@
 Aging scheduling algorithm.
 """
 
+from array import array
 from .base import SchedulerBase
 
 
@@ -15,16 +16,19 @@ class Aging(SchedulerBase):
     3. Selects highest priority process
     """
     
-    def __init__(self, processes, last_instant, output_formatter, quantum):
-        super().__init__(processes, last_instant, output_formatter)
+    def __init__(self, processes, last_instant, output_formatter, quantum, **kwargs):
+        super().__init__(processes, last_instant, output_formatter, **kwargs)
         self.quantum = quantum
-        # Store initial priorities
-        self.initial_priority = {p: p.priority for p in processes}
-        # Current priorities (higher value = higher priority)
-        self.current_priority = {p: p.priority for p in processes}
+        # Current priorities indexed by pid (higher value = higher priority);
+        # the initial priority is read back from the spec on reset
+        self.current_priority = array('q', [p.priority for p in processes])
     
     def schedule(self):
         """Implement Aging scheduling."""
+        remaining = self.state.remaining_time
+        priority = self.current_priority
+        arrivals = self.index.cursor()
+        ready_processes = []
         current_time = 0
         completed = 0
         total_processes = len(self.processes)
@@ -32,47 +36,50 @@ class Aging(SchedulerBase):
         quantum_used = 0
         
         while completed < total_processes and current_time < self.last_instant:
-            # Get all arrived processes with remaining time
-            ready_processes = [p for p in self.processes 
-                             if p.arrival_time <= current_time 
-                             and p.remaining_time > 0]
+            # Admit ready processes with remaining time
+            ready_processes.extend(p for p in self._admit(arrivals, current_time)
+                                   if remaining[p.pid] > 0)
             
             if not ready_processes:
                 # No process available, advance to next arrival
-                next_arrivals = [p.arrival_time for p in self.processes if p.remaining_time > 0]
-                if next_arrivals:
-                    current_time = min(next_arrivals)
-                else:
+                next_event = self._next_event_time(arrivals)
+                if next_event is None:
                     break
+                current_time = next_event
                 continue
             
             # If current process quantum expired or completed, select new process
-            if current_process is None or quantum_used >= self.quantum or current_process.remaining_time == 0:
+            if current_process is None or quantum_used >= self.quantum or remaining[current_process.pid] == 0:
                 # Reset current process priority if it exists
-                if current_process is not None and current_process.remaining_time > 0:
-                    self.current_priority[current_process] = self.initial_priority[current_process]
+                if current_process is not None and remaining[current_process.pid] > 0:
+                    priority[current_process.pid] = current_process.priority
                 
                 # Age all ready processes (except current)
                 for p in ready_processes:
-                    if p != current_process:
-                        self.current_priority[p] += 1
+                    if p is not current_process:
+                        priority[p.pid] += 1
                 
                 # Select process with highest priority
                 current_process = max(ready_processes, 
-                                    key=lambda p: (self.current_priority[p], -p.arrival_time))
+                                    key=lambda p: (priority[p.pid], -p.arrival_time, -p.pid))
                 quantum_used = 0
+                current_time = self._dispatch(current_process, current_time)
             
             # Execute current process for 1 time unit
             self.output.mark_executing(current_process.name, current_time)
             self._mark_waiting_processes(current_time, current_process)
             
-            current_process.remaining_time -= 1
+            remaining[current_process.pid] -= 1
             current_time += 1
             quantum_used += 1
             
-            # Check if process completed
-            if current_process.remaining_time == 0:
-                current_process.finish_time = current_time
-                completed += 1
+            # Check if process completed its CPU burst
+            if remaining[current_process.pid] == 0:
+                ready_processes.remove(current_process)
+                if self._complete_burst(current_process, current_time):
+                    completed += 1
+                else:
+                    # Blocked on I/O: it rejoins later at its initial priority
+                    priority[current_process.pid] = current_process.priority
                 current_process = None
                 quantum_used = 0
@@ -2,32 +2,50 @@
 Base class for all scheduling algorithms.
 """
 
+import heapq
 from abc import ABC, abstractmethod
-from typing import List
-from utils.process import Process
+from typing import List, Optional, Sequence
+from utils.process import ProcessSpec, RunState
 from utils.output import OutputFormatter
+from utils.workload import ArrivalCursor, WorkloadIndex
+from .io_device import IODevice
 
 
 class SchedulerBase(ABC):
     """Abstract base class for all scheduling algorithms."""
     
-    def __init__(self, processes: List[Process], last_instant: int, output_formatter: OutputFormatter):
+    def __init__(self, processes: Sequence[ProcessSpec], last_instant: int, output_formatter: OutputFormatter,
+                 context_switch: int = 0, dispatch_latency: int = 0,
+                 index: Optional[WorkloadIndex] = None):
         """
         Initialize scheduler.
         
         Args:
-            processes: List of processes to schedule
+            processes: Process specs to schedule (shared read-only, never copied)
             last_instant: Last time instant for simulation
             output_formatter: Output formatter for timeline/stats
+            context_switch: Time to switch away from a previously running job
+            dispatch_latency: Time to start any job that was not running before
+            index: Shared arrival index of the workload (built here if not given)
         """
-        self.processes = [p for p in processes]  # Create a copy
+        if context_switch < 0 or dispatch_latency < 0:
+            raise ValueError("Context switch and dispatch latency must not be negative")
+        self.processes = processes
+        self.index = index if index is not None else WorkloadIndex(processes)
         self.last_instant = last_instant
         self.output = output_formatter
         self.current_time = 0
+        self.context_switch = context_switch
+        self.dispatch_latency = dispatch_latency
         
-        # Reset all processes before scheduling
-        for process in self.processes:
-            process.reset()
+        # All mutable per-run data lives here, indexed by process id
+        self.state = RunState(processes)
+        self._running = None  # Job that held the CPU most recently
+        
+        # I/O devices by name, and a heap of (ready_time, pid) for processes
+        # blocked on I/O
+        self.devices = {}
+        self._io_returns = []
     
     @abstractmethod
     def schedule(self):
@@ -44,19 +62,123 @@ class SchedulerBase(ABC):
     
     def _calculate_all_stats(self):
         """Calculate statistics for all processes."""
-        for process in self.processes:
-            process.calculate_stats()
+        self.state.calculate_stats(self.processes)
+        self._calculate_utilization()
+    
+    def _calculate_utilization(self):
+        """Calculate CPU and I/O device utilization over the run."""
+        state = self.state
+        if all(state.finish_time[p.pid] for p in self.processes):
+            end_time = max(state.finish_time, default=0)
+        else:
+            end_time = self.last_instant
+        if end_time <= 0:
+            return
+        cpu_time = sum(state.cpu_time_used(p) for p in self.processes)
+        state.cpu_utilization = min(cpu_time, end_time) / end_time
+        state.device_utilization = {name: device.busy_time(end_time) / end_time
+                                    for name, device in self.devices.items()}
+    
+    def _complete_burst(self, process: ProcessSpec, current_time: int) -> bool:
+        """
+        Handle the end of a process's current CPU burst.
+        
+        If the process has no more bursts it finishes. Otherwise it blocks:
+        its next I/O burst is queued on the device, and its next CPU burst
+        becomes ready when that I/O completes.
+        
+        Returns:
+            True if the process finished, False if it blocked on I/O
+        """
+        state = self.state
+        pid = process.pid
+        index = state.burst_index[pid]
+        state.burst_index[pid] = index + 1
+        
+        if index >= len(process.io_bursts):
+            state.finish_time[pid] = current_time
+            state.remaining_time[pid] = 0
+            return True
+        
+        device_name, length = process.io_bursts[index]
+        device = self.devices.get(device_name)
+        if device is None:
+            device = self.devices[device_name] = IODevice(device_name)
+        _, completion = device.submit(pid, current_time, length)
+        
+        for t in range(current_time, min(completion, self.last_instant)):
+            self.output.mark_blocked(process.name, t)
+        
+        state.remaining_time[pid] = process.cpu_bursts[index + 1]
+        state.ready_time[pid] = completion
+        heapq.heappush(self._io_returns, (completion, pid))
+        return False
+    
+    def _pop_io_returns(self, current_time: int, inclusive: bool = True) -> List[ProcessSpec]:
+        """Remove and return processes whose I/O completed by current_time, in completion order."""
+        returned = []
+        while self._io_returns and (self._io_returns[0][0] < current_time or
+                                    (inclusive and self._io_returns[0][0] == current_time)):
+            _, pid = heapq.heappop(self._io_returns)
+            returned.append(self.processes[pid])
+        return returned
+    
+    def _next_io_return(self) -> Optional[int]:
+        """Time of the next I/O completion, or None if nothing is blocked."""
+        return self._io_returns[0][0] if self._io_returns else None
+    
+    def _admit(self, arrivals: ArrivalCursor, current_time: int, inclusive: bool = True) -> List[ProcessSpec]:
+        """Return processes that arrived or came back from I/O by current_time."""
+        admitted = list(arrivals.advance(current_time, inclusive))
+        admitted.extend(self._pop_io_returns(current_time, inclusive))
+        return admitted
+    
+    def _next_event_time(self, arrivals: ArrivalCursor) -> Optional[int]:
+        """Time of the next arrival or I/O completion, or None if neither is pending."""
+        times = [t for t in (arrivals.peek(), self._next_io_return()) if t is not None]
+        return min(times) if times else None
+    
+    def _dispatch(self, process: ProcessSpec, current_time: int) -> int:
+        """
+        Give the CPU to process, charging switch overhead if the running job changes.
+        
+        The overhead is dispatch_latency for every change of job, plus
+        context_switch if another job ran before. Overhead time is shown as a
+        switch in the trace and is not credited to the process.
+        
+        Returns:
+            Time at which the process actually starts executing
+        """
+        if process is self._running:
+            return current_time
+        
+        cost = self.dispatch_latency
+        if self._running is not None:
+            # A job change; the very first dispatch is not one
+            cost += self.context_switch
+            self.state.switch_count += 1
+        self._running = process
+        self.state.switch_time += cost
+        
+        for t in range(current_time, current_time + cost):
+            self.output.mark_switching(process.name, t)
+            self._mark_waiting_processes(t, process)
+        return current_time + cost
     
-    def _get_arrived_processes(self, current_time: int) -> List[Process]:
-        """Get all processes that have arrived by current_time."""
-        return [p for p in self.processes if p.arrival_time <= current_time and p.remaining_time > 0]
+    def _get_arrived_processes(self, current_time: int) -> List[ProcessSpec]:
+        """Get all processes that are ready (arrived and not blocked) at current_time."""
+        remaining = self.state.remaining_time
+        ready_time = self.state.ready_time
+        return [p for p in self.processes if ready_time[p.pid] <= current_time and remaining[p.pid] > 0]
     
-    def _mark_waiting_processes(self, current_time: int, executing_process: Process = None):
-        """Mark all arrived but not executing processes as waiting."""
+    def _mark_waiting_processes(self, current_time: int, executing_process: ProcessSpec = None):
+        """Mark all ready but not executing processes as waiting."""
+        remaining = self.state.remaining_time
+        ready_time = self.state.ready_time
         for process in self.processes:
-            if (process.arrival_time <= current_time and 
-                process.remaining_time > 0 and 
-                process != executing_process):
+            if (ready_time[process.pid] <= current_time and 
+                remaining[process.pid] > 0 and 
+                process is not executing_process):
                 self.output.mark_waiting(process.name, current_time)
     
     def __repr__(self):
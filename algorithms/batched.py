@@ -0,0 +1,232 @@
+"""
+Batched NumPy simulation of many small workloads at once.
+
+Each supported policy is re-expressed as a per-time-unit step over padded
+(K workloads x N processes) arrays, so one Python loop iteration advances
+every workload. Results match the scalar schedulers exactly. NumPy is an
+optional dependency, only needed by this module.
+"""
+
+from typing import List, Optional, Sequence
+from utils.process import ProcessSpec, RunState
+from .round_robin import RoundRobin
+from .feedback import FeedbackBase, FB1, FB2i
+from .srt import SRT
+from .adaptive import AdaptiveQuantumMixin
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+
+class BatchResult:
+    """Per-workload results of a batched simulation."""
+
+    def __init__(self, workloads, finish_time):
+        """
+        Args:
+            workloads: The simulated workloads
+            finish_time: (K, N) array of finish times (0 = did not finish)
+        """
+        self.workloads = workloads
+        self.finish_time = finish_time
+
+    def state(self, k: int) -> RunState:
+        """Return workload k's results as a RunState, with statistics calculated."""
+        processes = self.workloads[k]
+        state = RunState(processes)
+        for process in processes:
+            state.finish_time[process.pid] = int(self.finish_time[k, process.pid])
+            state.remaining_time[process.pid] = 0 if state.finish_time[process.pid] else process.service_time
+        state.calculate_stats(processes)
+        return state
+
+    def mean_turnaround(self) -> List[float]:
+        """Mean turnaround time of each workload."""
+        means = []
+        for k, processes in enumerate(self.workloads):
+            state = self.state(k)
+            means.append(sum(state.turnaround_time) / len(processes))
+        return means
+
+    def __len__(self):
+        return len(self.workloads)
+
+    def __repr__(self):
+        return f"BatchResult(workloads={len(self.workloads)})"
+
+
+class _Batch:
+    """Padded arrays of K workloads; padding processes never arrive."""
+
+    def __init__(self, workloads: Sequence[Sequence[ProcessSpec]], last_instants: Sequence[int]):
+        k = len(workloads)
+        n = max(len(processes) for processes in workloads)
+        self.never = np.iinfo(np.int64).max // 4
+        self.arrival = np.full((k, n), self.never, dtype=np.int64)
+        self.remaining = np.zeros((k, n), dtype=np.int64)
+        for i, processes in enumerate(workloads):
+            for process in processes:
+                self.arrival[i, process.pid] = process.arrival_time
+                self.remaining[i, process.pid] = process.service_time
+        self.last_instant = np.asarray(last_instants, dtype=np.int64)
+        self.finish = np.zeros((k, n), dtype=np.int64)
+        self.rows = np.arange(k)
+
+    def next_arrival_after(self, t: int) -> int:
+        """Earliest arrival later than t in any workload (never if none)."""
+        future = self.arrival[self.arrival > t]
+        return int(future.min()) if future.size else self.never
+
+
+def _simulate_queue(batch: '_Batch', quantum_of_level, num_levels: int, demote: bool):
+    """
+    Lockstep simulation of RR (one FIFO level) and Feedback (several levels).
+
+    Ready processes carry (level, sequence); the head of the queue is the
+    smallest pair. A preempted process is re-queued at the start of the next
+    time unit, before processes arriving at that instant, as in the scalar
+    schedulers.
+    """
+    k, n = batch.arrival.shape
+    rows = batch.rows
+    queued = np.zeros((k, n), dtype=bool)
+    sequence = np.zeros((k, n), dtype=np.int64)
+    level = np.zeros((k, n), dtype=np.int64)
+    counter = np.zeros(k, dtype=np.int64)
+    running = np.full(k, -1, dtype=np.int64)
+    used = np.zeros(k, dtype=np.int64)
+    pending = np.full(k, -1, dtype=np.int64)  # Preempted process to re-queue
+    finished = batch.arrival == batch.never  # Padding counts as finished
+    big = np.int64(1) << 40
+    t = 0
+
+    while True:
+        unfinished = (~finished).any(axis=1)
+        active = (running >= 0) | (pending >= 0) | ((t < batch.last_instant) & unfinished)
+        if not active.any():
+            break
+
+        # Re-queue processes preempted at the end of the previous time unit
+        requeue = np.nonzero(pending >= 0)[0]
+        if requeue.size:
+            p = pending[requeue]
+            if demote:
+                level[requeue, p] = np.minimum(level[requeue, p] + 1, num_levels - 1)
+            queued[requeue, p] = True
+            sequence[requeue, p] = counter[requeue]
+            counter[requeue] += 1
+            pending[requeue] = -1
+
+        # Admit processes arriving now, in pid order, at the top level
+        arriving = batch.arrival == t
+        if arriving.any():
+            order = np.cumsum(arriving, axis=1) - 1
+            sequence = np.where(arriving, counter[:, None] + order, sequence)
+            level = np.where(arriving, 0, level)
+            queued |= arriving
+            counter += arriving.sum(axis=1)
+
+        # Idle CPUs take the head of their queue. A process with no service
+        # time finishes as soon as it is picked, and the CPU picks again
+        idle = (running < 0) & (t < batch.last_instant) & queued.any(axis=1)
+        while idle.any():
+            keys = np.where(queued, level * big + sequence, np.iinfo(np.int64).max)
+            head = keys.argmin(axis=1)
+            picked = rows[idle]
+            p = head[picked]
+            queued[picked, p] = False
+            used[picked] = 0
+            empty = batch.remaining[picked, p] == 0
+            batch.finish[picked[empty], p[empty]] = t
+            finished[picked[empty], p[empty]] = True
+            running[picked[~empty]] = p[~empty]
+            idle = (running < 0) & (t < batch.last_instant) & queued.any(axis=1)
+
+        busy = np.nonzero(running >= 0)[0]
+        if busy.size == 0:
+            # Nothing running anywhere: jump to the next arrival
+            t = max(t + 1, batch.next_arrival_after(t))
+            continue
+
+        # Execute one time unit
+        p = running[busy]
+        batch.remaining[busy, p] -= 1
+        used[busy] += 1
+        done = batch.remaining[busy, p] == 0
+        batch.finish[busy[done], p[done]] = t + 1
+        finished[busy[done], p[done]] = True
+        expired = ~done & (used[busy] >= quantum_of_level(level[busy, p]))
+        pending[busy[expired]] = p[expired]
+        running[busy[done | expired]] = -1
+        t += 1
+
+
+def _simulate_srt(batch: '_Batch'):
+    """Lockstep simulation of SRT: every time unit, each workload runs its shortest remaining job."""
+    rows = batch.rows
+    infinity = np.iinfo(np.int64).max
+    t = 0
+    while True:
+        live = (t < batch.last_instant) & (batch.remaining > 0).any(axis=1)
+        if not live.any():
+            break
+        candidates = (batch.arrival <= t) & (batch.remaining > 0) & live[:, None]
+        has_candidate = candidates.any(axis=1)
+        if not has_candidate.any():
+            t = max(t + 1, batch.next_arrival_after(t))
+            continue
+        choice = np.where(candidates, batch.remaining, infinity).argmin(axis=1)
+        picked = rows[has_candidate]
+        p = choice[picked]
+        batch.remaining[picked, p] -= 1
+        done = batch.remaining[picked, p] == 0
+        batch.finish[picked[done], p[done]] = t + 1
+        t += 1
+
+
+def simulate_batch(scheduler_class, workloads: Sequence[Sequence[ProcessSpec]],
+                   last_instants, *scheduler_args, num_queues: Optional[int] = None) -> BatchResult:
+    """
+    Simulate many independent workloads in lockstep.
+
+    Args:
+        scheduler_class: RoundRobin, FB1, FB2i or SRT
+        workloads: Sequence of workloads (each a list of specs with pid == index)
+        last_instants: Last time instant of every workload, or one int for all
+        scheduler_args: Extra scheduler arguments (the quantum for RoundRobin)
+        num_queues: Number of Feedback levels (defaults to the scalar default)
+
+    Returns:
+        BatchResult with the same finish times as the scalar scheduler
+    """
+    if np is None:
+        raise ImportError("The batched engine requires NumPy (pip install numpy)")
+    if not workloads:
+        return BatchResult([], None)
+    if any(p.has_io for processes in workloads for p in processes):
+        raise ValueError("The batched engine supports single CPU burst workloads only")
+    if isinstance(last_instants, int):
+        last_instants = [last_instants] * len(workloads)
+
+    batch = _Batch(workloads, last_instants)
+    if issubclass(scheduler_class, AdaptiveQuantumMixin):
+        raise ValueError(f"No batched kernel for {scheduler_class.__name__}")
+    elif issubclass(scheduler_class, RoundRobin):
+        quantum = scheduler_args[0] if scheduler_args else 1
+        _simulate_queue(batch, lambda level: quantum, 1, demote=False)
+    elif issubclass(scheduler_class, FeedbackBase):
+        if num_queues is None:
+            num_queues = 3
+        if issubclass(scheduler_class, FB2i):
+            _simulate_queue(batch, lambda level: np.left_shift(1, level), num_queues, demote=True)
+        elif issubclass(scheduler_class, FB1):
+            _simulate_queue(batch, lambda level: 1, num_queues, demote=True)
+        else:
+            raise ValueError(f"No batched kernel for {scheduler_class.__name__}")
+    elif issubclass(scheduler_class, SRT):
+        _simulate_srt(batch)
+    else:
+        raise ValueError(f"No batched kernel for {scheduler_class.__name__}")
+    return BatchResult(list(workloads), batch.finish)
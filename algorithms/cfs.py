@@ -0,0 +1,67 @@
+"""
+Completely Fair Scheduler (CFS) style scheduling algorithm.
+"""
+
+from array import array
+from .run_queue import RunQueueScheduler
+
+
+class CFS(RunQueueScheduler):
+    """
+    Linux-style Completely Fair Scheduler.
+    Each process accumulates virtual runtime (CPU time scaled by its weight)
+    and the process with the smallest virtual runtime runs next.
+    Weights come from priority (higher priority = larger weight = more CPU).
+    Each slice is the target latency split among runnable processes by
+    weight, but never shorter than the minimum granularity. A slice also ends
+    at the next arrival or I/O completion, so a woken process with a smaller
+    virtual runtime preempts the running one.
+    """
+
+    NICE_0_WEIGHT = 1024
+    TARGET_LATENCY = 6
+
+    def __init__(self, processes, last_instant, output_formatter, granularity=1, **kwargs):
+        super().__init__(processes, last_instant, output_formatter, **kwargs)
+        self.granularity = granularity
+        self.weight = array('q', [max(1, p.priority) for p in processes])
+        self.vruntime = array('d', [0.0]) * len(processes)
+        self.min_vruntime = 0.0
+        self._queued_weight = 0  # Total weight of processes in the run queue
+
+    def queue_key(self, process):
+        """Smallest virtual runtime first."""
+        return self.vruntime[process.pid]
+
+    def _enqueue(self, process):
+        self._queued_weight += self.weight[process.pid]
+        super()._enqueue(process)
+
+    def _dequeue(self):
+        process = super()._dequeue()
+        self._queued_weight -= self.weight[process.pid]
+        return process
+
+    def on_ready(self, process):
+        """Place new and woken processes at the current minimum virtual runtime."""
+        pid = process.pid
+        self.vruntime[pid] = max(self.vruntime[pid], self.min_vruntime)
+
+    def time_slice(self, process, current_time, next_event):
+        """Weighted share of the scheduling period, cut short by the next wakeup."""
+        running = len(self.run_queue) + 1
+        period = max(self.TARGET_LATENCY, running * self.granularity)
+        weight = self.weight[process.pid]
+        total_weight = self._queued_weight + weight
+        time_slice = period * weight // total_weight
+        if next_event is not None:
+            # Wakeup preemption: re-pick by virtual runtime once it arrives
+            time_slice = min(time_slice, next_event - current_time)
+        return max(self.granularity, time_slice)
+
+    def charge(self, process, run_time):
+        """Advance virtual runtime inversely to weight."""
+        pid = process.pid
+        # The running process was the leftmost one when picked
+        self.min_vruntime = max(self.min_vruntime, self.vruntime[pid])
+        self.vruntime[pid] += run_time * self.NICE_0_WEIGHT / self.weight[pid]
@@ -0,0 +1,27 @@
+"""
+Earliest Deadline First (EDF) scheduling algorithm.
+"""
+
+from .run_queue import RunQueueScheduler
+
+
+class EDF(RunQueueScheduler):
+    """
+    Earliest Deadline First scheduling algorithm.
+    Preemptive: The ready process with the earliest deadline runs; the
+    decision is revisited whenever a process arrives or returns from I/O.
+    Processes without a deadline run only when no deadline is pending.
+    """
+
+    NO_DEADLINE = float('inf')
+
+    def queue_key(self, process):
+        """Earliest deadline first, then earliest arrival."""
+        deadline = self.NO_DEADLINE if process.deadline is None else process.deadline
+        return (deadline, process.arrival_time, process.pid)
+
+    def time_slice(self, process, current_time, next_event):
+        """Run until the next arrival or I/O completion could preempt."""
+        if next_event is None:
+            return self.state.remaining_time[process.pid]
+        return next_event - current_time
@@ -8,30 +8,43 @@ from .base import SchedulerBase
 class FCFS(SchedulerBase):
     """
     First Come First Serve scheduling algorithm.
-    Processes are executed in the order they arrive.
-    Non-preemptive: Once a process starts, it runs to completion.
+    Processes are executed in the order they arrive (or return from I/O).
+    Non-preemptive: Once a process starts, it runs until its CPU burst ends.
     """
     
     def schedule(self):
         """Implement FCFS scheduling."""
-        # Sort processes by arrival time
-        ready_queue = sorted(self.processes, key=lambda p: p.arrival_time)
-        
+        state = self.state
+        remaining = state.remaining_time
+        ready_time = state.ready_time
+        arrivals = self.index.cursor()
+        available = []
         current_time = 0
+        completed = 0
         
-        for process in ready_queue:
-            # If CPU is idle, advance time to next process arrival
-            if current_time < process.arrival_time:
-                current_time = process.arrival_time
+        while completed < len(self.processes):
+            # Admit processes that are ready (arrived, or back from I/O)
+            available.extend(self._admit(arrivals, current_time))
+            
+            if not available:
+                # If CPU is idle, advance time to next process arrival
+                current_time = self._next_event_time(arrivals)
+                continue
+            
+            # Select the process that has been ready the longest
+            process = min(available, key=lambda p: (ready_time[p.pid], p.pid))
+            available.remove(process)
+            current_time = self._dispatch(process, current_time)
+            burst = remaining[process.pid]
             
             # Execute the process
-            for t in range(current_time, current_time + process.service_time):
+            for t in range(current_time, current_time + burst):
                 if t < self.last_instant:
                     self.output.mark_executing(process.name, t)
                     # Mark other arrived processes as waiting
                     self._mark_waiting_processes(t, process)
             
             # Update process completion time
-            current_time += process.service_time
-            process.finish_time = current_time
-            process.remaining_time = 0
+            current_time += burst
+            if self._complete_burst(process, current_time):
+                completed += 1
@@ -9,8 +9,8 @@ from .base import SchedulerBase
 class FeedbackBase(SchedulerBase):
     """Base class for Feedback scheduling algorithms."""
     
-    def __init__(self, processes, last_instant, output_formatter, num_queues=3):
-        super().__init__(processes, last_instant, output_formatter)
+    def __init__(self, processes, last_instant, output_formatter, num_queues=3, **kwargs):
+        super().__init__(processes, last_instant, output_formatter, **kwargs)
         self.num_queues = num_queues
         self.queues = [deque() for _ in range(num_queues)]
     
@@ -20,21 +20,17 @@ class FeedbackBase(SchedulerBase):
     
     def schedule(self):
         """Implement Feedback scheduling."""
+        remaining = self.state.remaining_time
         current_time = 0
         completed = 0
         total_processes = len(self.processes)
         
-        # Track process queue levels
-        process_queue_level = {p: 0 for p in self.processes}
-        
-        process_index = 0
-        processes_sorted = sorted(self.processes, key=lambda p: p.arrival_time)
+        arrivals = self.index.cursor()
         
         while completed < total_processes and current_time < self.last_instant:
-            # Add newly arrived processes to highest priority queue (queue 0)
-            while process_index < len(processes_sorted) and processes_sorted[process_index].arrival_time <= current_time:
-                self.queues[0].append(processes_sorted[process_index])
-                process_index += 1
+            # Add newly arrived processes to highest priority queue (queue 0);
+            # processes returning from I/O re-enter there too
+            self.queues[0].extend(self._admit(arrivals, current_time))
             
             # Find highest priority non-empty queue
             process = None
@@ -46,16 +42,18 @@ class FeedbackBase(SchedulerBase):
                     break
             
             if process is None:
-                # No process available, advance to next arrival
-                if process_index < len(processes_sorted):
-                    current_time = processes_sorted[process_index].arrival_time
-                else:
+                # No process available, advance to next arrival or I/O completion
+                next_event = self._next_event_time(arrivals)
+                if next_event is None:
                     break
+                current_time = next_event
                 continue
             
+            current_time = self._dispatch(process, current_time)
+            
             # Get quantum for current queue level
             quantum = self.get_quantum(current_queue_level)
-            execution_time = min(quantum, process.remaining_time)
+            execution_time = min(quantum, remaining[process.pid])
             
             # Execute process
             for t in range(execution_time):
@@ -63,19 +61,16 @@ class FeedbackBase(SchedulerBase):
                     self.output.mark_executing(process.name, current_time)
                     self._mark_waiting_processes(current_time, process)
                 current_time += 1
-                process.remaining_time -= 1
+                remaining[process.pid] -= 1
             
             # Check for new arrivals during execution
-            while process_index < len(processes_sorted) and processes_sorted[process_index].arrival_time < current_time:
-                self.queues[0].append(processes_sorted[process_index])
-                process_index += 1
+            self.queues[0].extend(self._admit(arrivals, current_time, inclusive=False))
             
             # If process not finished, move to lower priority queue
-            if process.remaining_time > 0:
+            if remaining[process.pid] > 0:
                 next_level = min(current_queue_level + 1, self.num_queues - 1)
                 self.queues[next_level].append(process)
-            else:
-                process.finish_time = current_time
+            elif self._complete_burst(process, current_time):
                 completed += 1
 
 
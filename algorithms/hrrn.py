@@ -14,40 +14,49 @@ class HRRN(SchedulerBase):
     
     def schedule(self):
         """Implement HRRN scheduling."""
+        state = self.state
+        remaining = state.remaining_time
+        ready_time = state.ready_time
+        arrivals = self.index.cursor()
+        available = []
         current_time = 0
-        completed = []
+        completed = 0
         
-        while len(completed) < len(self.processes):
-            # Get all arrived processes that haven't completed
-            available = [p for p in self.processes 
-                        if p.arrival_time <= current_time 
-                        and p not in completed]
+        while completed < len(self.processes):
+            # Admit ready processes that haven't completed
+            available.extend(self._admit(arrivals, current_time))
             
             if not available:
                 # No process available, advance to next arrival
-                next_arrival = min(p.arrival_time for p in self.processes if p not in completed)
-                current_time = next_arrival
+                current_time = self._next_event_time(arrivals)
                 continue
             
             # Calculate response ratio for each available process
+            # (waiting since it became ready, for its next CPU burst);
+            # ties go to the process listed first in the input
             best_process = None
             best_ratio = -1
             
             for process in available:
-                wait_time = current_time - process.arrival_time
-                response_ratio = (wait_time + process.service_time) / process.service_time
+                wait_time = current_time - ready_time[process.pid]
+                burst = remaining[process.pid]
+                response_ratio = (wait_time + burst) / burst
                 
-                if response_ratio > best_ratio:
+                if (response_ratio > best_ratio or
+                        (response_ratio == best_ratio and process.pid < best_process.pid)):
                     best_ratio = response_ratio
                     best_process = process
             
-            # Execute the selected process to completion
-            for t in range(current_time, current_time + best_process.service_time):
+            available.remove(best_process)
+            current_time = self._dispatch(best_process, current_time)
+            burst = remaining[best_process.pid]
+            
+            # Execute the selected process to completion of its burst
+            for t in range(current_time, current_time + burst):
                 if t < self.last_instant:
                     self.output.mark_executing(best_process.name, t)
                     self._mark_waiting_processes(t, best_process)
             
-            current_time += best_process.service_time
-            best_process.finish_time = current_time
-            best_process.remaining_time = 0
-            completed.append(best_process)
+            current_time += burst
+            if self._complete_burst(best_process, current_time):
+                completed += 1
@@ -0,0 +1,45 @@
+"""
+I/O device model used by the scheduler core for blocked processes.
+"""
+
+from typing import List, Tuple
+
+
+class IODevice:
+    """
+    A single I/O device serving requests first come first serve.
+    Requests reach the device in time order (they are issued when a CPU burst
+    ends, and only one CPU burst ends at a time), so each request's start and
+    completion are known as soon as it is submitted.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.busy_until = 0
+        # (pid, start, completion) of every request, in service order
+        self.requests: List[Tuple[int, int, int]] = []
+
+    def submit(self, pid: int, time: int, length: int) -> Tuple[int, int]:
+        """
+        Queue an I/O request.
+
+        Args:
+            pid: Process issuing the request
+            time: Time the request is issued
+            length: Service time of the request
+
+        Returns:
+            (start, completion) times of the request
+        """
+        start = max(time, self.busy_until)
+        self.busy_until = start + length
+        self.requests.append((pid, start, self.busy_until))
+        return start, self.busy_until
+
+    def busy_time(self, end_time: int) -> int:
+        """Time the device spent serving requests before end_time."""
+        return sum(min(done, end_time) - start
+                   for _, start, done in self.requests if start < end_time)
+
+    def __repr__(self):
+        return f"IODevice({self.name}, busy_until={self.busy_until})"
@@ -0,0 +1,133 @@
+"""
+Base class for schedulers driven by an ordered (heap-based) run queue.
+"""
+
+import heapq
+from abc import abstractmethod
+from itertools import count
+from .base import SchedulerBase
+
+
+class RunQueueScheduler(SchedulerBase):
+    """
+    Base class for schedulers that keep ready processes in a binary heap.
+    Picking the next process and re-queueing the current one are O(log n),
+    instead of the linear scans used by SRT and Aging. A process's key only
+    changes while it is running (out of the heap), so no decrease-key or
+    lazy invalidation is needed.
+    Subclasses define the ordering key, the time slice and how running time
+    is charged.
+    """
+
+    def __init__(self, processes, last_instant, output_formatter, **kwargs):
+        super().__init__(processes, last_instant, output_formatter, **kwargs)
+        self.run_queue = []  # Heap of (key, sequence, pid)
+        self._sequence = count()  # FIFO order among equal keys
+        self._arrivals = None  # Arrival cursor of the current run
+
+    @abstractmethod
+    def queue_key(self, process):
+        """Return the ordering key of a ready process (smallest runs first)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def time_slice(self, process, current_time, next_event):
+        """
+        Return how long process may run before the scheduler decides again.
+
+        Args:
+            process: Process about to run
+            current_time: Time it starts executing
+            next_event: Time of the next arrival or I/O completion, or None
+        """
+        raise NotImplementedError
+
+    def charge(self, process, run_time):
+        """Account for run_time units of CPU used by process. Override if needed."""
+        pass
+
+    def on_ready(self, process):
+        """Hook called when process joins the run queue from outside (arrival or I/O)."""
+        pass
+
+    def _enqueue(self, process):
+        heapq.heappush(self.run_queue, (self.queue_key(process), next(self._sequence), process.pid))
+
+    def _dequeue(self):
+        _, _, pid = heapq.heappop(self.run_queue)
+        return self.processes[pid]
+
+    def _admit_ready(self, arrivals, current_time, inclusive=True) -> int:
+        """
+        Queue processes that became ready. A process with no CPU time left
+        completes its burst the moment it is ready instead of being queued.
+
+        Returns:
+            Number of processes that finished on admission
+        """
+        finished = 0
+        for process in self._admit(arrivals, current_time, inclusive):
+            if self.state.remaining_time[process.pid] == 0:
+                if self._complete_burst(process, self.state.ready_time[process.pid]):
+                    finished += 1
+                continue
+            self.on_ready(process)
+            self._enqueue(process)
+        return finished
+
+    def _mark_waiting_processes(self, current_time, executing_process=None):
+        """
+        Mark ready processes other than executing_process as waiting.
+        Only the run queue and processes that became ready during the current
+        slice (not admitted yet) are visited, instead of the whole workload.
+        """
+        remaining = self.state.remaining_time
+        waiting = [self.processes[pid] for _, _, pid in self.run_queue]
+        if self._arrivals is not None:
+            waiting.extend(self._arrivals.arrived_by(current_time))
+        waiting.extend(self.processes[pid] for ready_time, pid in self._io_returns
+                       if ready_time <= current_time)
+        for process in waiting:
+            if process is not executing_process and remaining[process.pid] > 0:
+                self.output.mark_waiting(process.name, current_time)
+
+    def schedule(self):
+        """Run the process at the head of the run queue, one slice at a time."""
+        remaining = self.state.remaining_time
+        arrivals = self._arrivals = self.index.cursor()
+        current_time = 0
+        completed = 0
+        total_processes = len(self.processes)
+
+        while completed < total_processes and current_time < self.last_instant:
+            completed += self._admit_ready(arrivals, current_time)
+
+            if not self.run_queue:
+                # CPU idle - advance to next process arrival or I/O completion
+                next_event = self._next_event_time(arrivals)
+                if next_event is None:
+                    break
+                current_time = next_event
+                continue
+
+            process = self._dequeue()
+            current_time = self._dispatch(process, current_time)
+
+            time_slice = self.time_slice(process, current_time, self._next_event_time(arrivals))
+            run_time = min(max(time_slice, 1), remaining[process.pid])
+
+            for t in range(run_time):
+                if current_time < self.last_instant:
+                    self.output.mark_executing(process.name, current_time)
+                    self._mark_waiting_processes(current_time, process)
+                current_time += 1
+                remaining[process.pid] -= 1
+            self.charge(process, run_time)
+
+            # Check for new arrivals during execution
+            completed += self._admit_ready(arrivals, current_time, inclusive=False)
+
+            if remaining[process.pid] > 0:
+                self._enqueue(process)
+            elif self._complete_burst(process, current_time):
+                completed += 1
@@ -0,0 +1,117 @@
+"""
+Sharded execution of work-conserving schedulers over independent busy periods.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from utils.output import OutputFormatter
+from utils.process import ProcessSpec
+from .base import SchedulerBase
+from .fcfs import FCFS
+from .round_robin import RoundRobin
+from .spn import SPN
+from .srt import SRT
+from .hrrn import HRRN
+from .feedback import FeedbackBase
+from .adaptive import AdaptiveQuantumMixin
+
+
+def _run_shard(task):
+    """
+    Simulate one busy period (runs in a worker process).
+
+    The period is simulated with time shifted to start at its first arrival,
+    and only its [start, end) window is recorded, so the returned timeline
+    rows are as long as the period rather than the whole run.
+    """
+    scheduler_class, scheduler_args, specs, start, end, last_instant = task
+    # Re-number pids so the shard gets its own compact run state
+    local = [ProcessSpec(i, p.name, p.arrival_time - start, p.service_time, p.priority,
+                         p.cpu_bursts, p.io_bursts,
+                         None if p.deadline is None else p.deadline - start)
+             for i, p in enumerate(specs)]
+    output = OutputFormatter(max(0, end - start), local)
+    scheduler = scheduler_class(local, last_instant - start, output, *scheduler_args)
+    scheduler.schedule()
+    state = scheduler.state
+    finish_times = [state.finish_time[i] + start if state.burst_index[i] else 0
+                    for i in range(len(local))]
+    # Dispatches = job changes plus the shard's first dispatch, if any
+    dispatches = state.switch_count + (scheduler._running is not None)
+    return output.timeline, finish_times, dispatches
+
+
+class ShardedScheduler(SchedulerBase):
+    """
+    Runs another scheduler separately on each busy period of the workload.
+    For a work-conserving policy the schedule splits at idle points, so the
+    busy periods are simulated independently in a process pool and their
+    timelines and finish times are stitched back together.
+    Switches are modeled as free and every process must be a single CPU
+    burst: with switch costs or I/O the idle points depend on the policy, so
+    busy periods are no longer independent.
+    """
+
+    SHARDABLE = (FCFS, RoundRobin, SPN, SRT, HRRN, FeedbackBase)
+
+    @classmethod
+    def can_shard(cls, scheduler_class) -> bool:
+        """Whether scheduler_class can run busy periods independently."""
+        # An adaptive quantum carries what it learned from one busy period into the next
+        return (issubclass(scheduler_class, cls.SHARDABLE)
+                and not issubclass(scheduler_class, AdaptiveQuantumMixin))
+
+    def __init__(self, processes, last_instant, output_formatter, scheduler_class,
+                 *scheduler_args, workers=None, index=None):
+        """
+        Initialize sharded scheduler.
+
+        Args:
+            processes: Process specs to schedule
+            last_instant: Last time instant for simulation
+            output_formatter: Output formatter for timeline/stats
+            scheduler_class: Scheduler to run on each busy period
+            scheduler_args: Extra constructor arguments (e.g. quantum)
+            workers: Number of worker processes (None = all cores)
+            index: Shared arrival index of the workload
+        """
+        if not self.can_shard(scheduler_class):
+            raise ValueError(f"{scheduler_class.__name__} cannot be sharded by busy period")
+        if any(p.has_io for p in processes):
+            raise ValueError("Workloads with I/O bursts cannot be sharded by busy period")
+        super().__init__(processes, last_instant, output_formatter, index=index)
+        self.scheduler_class = scheduler_class
+        self.scheduler_args = scheduler_args
+        self.workers = workers
+
+    def schedule(self):
+        """Simulate every busy period and merge the results."""
+        tasks = []
+        for period in self.index.busy_periods():
+            start = min(p.arrival_time for p in period)
+            # The CPU never idles inside a period, so it ends after all its work
+            end = min(start + sum(p.service_time for p in period), self.last_instant)
+            tasks.append((self.scheduler_class, self.scheduler_args, period, start, end,
+                          self.last_instant))
+
+        if len(tasks) > 1 and self.workers != 1:
+            workers = self.workers or os.cpu_count() or 1
+            chunksize = max(1, len(tasks) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_run_shard, tasks, chunksize=chunksize))
+        else:
+            results = [_run_shard(task) for task in tasks]
+
+        dispatches = 0
+        for task, (timeline, finish_times, shard_dispatches) in zip(tasks, results):
+            period, start = task[2], task[3]
+            self.output.merge_timeline(timeline, start)
+            dispatches += shard_dispatches
+            for process, finish_time in zip(period, finish_times):
+                self.state.finish_time[process.pid] = finish_time
+        # A sequential run counts every dispatch after the first as a job change
+        self.state.switch_count = max(0, dispatches - 1)
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}({self.scheduler_class.__name__}, "
+                f"processes={len(self.processes)})")
@@ -8,36 +8,40 @@ from .base import SchedulerBase
 class SPN(SchedulerBase):
     """
     Shortest Process Next scheduling algorithm.
-    Non-preemptive: Always selects the process with shortest service time.
+    Non-preemptive: Always selects the process with shortest service time
+    (the shortest next CPU burst for processes that do I/O).
     """
     
     def schedule(self):
         """Implement SPN scheduling."""
+        state = self.state
+        remaining = state.remaining_time
+        arrivals = self.index.cursor()
+        available = []
         current_time = 0
-        completed = []
+        completed = 0
         
-        while len(completed) < len(self.processes):
-            # Get all arrived processes that haven't completed
-            available = [p for p in self.processes 
-                        if p.arrival_time <= current_time 
-                        and p not in completed]
+        while completed < len(self.processes):
+            # Admit ready processes that haven't completed
+            available.extend(self._admit(arrivals, current_time))
             
             if not available:
                 # No process available, advance to next arrival
-                next_arrival = min(p.arrival_time for p in self.processes if p not in completed)
-                current_time = next_arrival
+                current_time = self._next_event_time(arrivals)
                 continue
             
-            # Select process with shortest service time
-            process = min(available, key=lambda p: p.service_time)
+            # Select process with shortest next CPU burst
+            process = min(available, key=lambda p: (remaining[p.pid], p.pid))
+            available.remove(process)
+            current_time = self._dispatch(process, current_time)
+            burst = remaining[process.pid]
             
-            # Execute the process to completion
-            for t in range(current_time, current_time + process.service_time):
+            # Execute the process to completion of its burst
+            for t in range(current_time, current_time + burst):
                 if t < self.last_instant:
                     self.output.mark_executing(process.name, t)
                     self._mark_waiting_processes(t, process)
             
-            current_time += process.service_time
-            process.finish_time = current_time
-            process.remaining_time = 0
-            completed.append(process)
+            current_time += burst
+            if self._complete_burst(process, current_time):
+                completed += 1
@@ -13,36 +13,38 @@ class SRT(SchedulerBase):
     
     def schedule(self):
         """Implement SRT scheduling."""
+        remaining = self.state.remaining_time
+        arrivals = self.index.cursor()
+        available = []
         current_time = 0
         completed = 0
         total_processes = len(self.processes)
         
         while completed < total_processes and current_time < self.last_instant:
-            # Get all arrived processes with remaining time
-            available = [p for p in self.processes 
-                        if p.arrival_time <= current_time 
-                        and p.remaining_time > 0]
+            # Admit ready processes with remaining time
+            available.extend(p for p in self._admit(arrivals, current_time) if remaining[p.pid] > 0)
             
             if not available:
                 # No process available, advance to next arrival
-                next_arrivals = [p.arrival_time for p in self.processes if p.remaining_time > 0]
-                if next_arrivals:
-                    current_time = min(next_arrivals)
-                else:
+                next_event = self._next_event_time(arrivals)
+                if next_event is None:
                     break
+                current_time = next_event
                 continue
             
             # Select process with shortest remaining time
-            process = min(available, key=lambda p: p.remaining_time)
+            process = min(available, key=lambda p: (remaining[p.pid], p.pid))
+            current_time = self._dispatch(process, current_time)
             
             # Execute for 1 time unit
             self.output.mark_executing(process.name, current_time)
             self._mark_waiting_processes(current_time, process)
             
-            process.remaining_time -= 1
+            remaining[process.pid] -= 1
             current_time += 1
             
-            # Check if process completed
-            if process.remaining_time == 0:
-                process.finish_time = current_time
-                completed += 1
+            # Check if process completed its CPU burst
+            if remaining[process.pid] == 0:
+                available.remove(process)
+                if self._complete_burst(process, current_time):
+                    completed += 1
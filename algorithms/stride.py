@@ -0,0 +1,43 @@
+"""
+Stride scheduling algorithm.
+"""
+
+from array import array
+from .run_queue import RunQueueScheduler
+
+
+class Stride(RunQueueScheduler):
+    """
+    Stride scheduling (deterministic proportional share).
+    Each process holds tickets (its priority) and a stride inversely
+    proportional to them. The process with the smallest pass value runs for
+    one quantum, then its pass advances by its stride per time unit used.
+    """
+
+    STRIDE1 = 1 << 20
+
+    def __init__(self, processes, last_instant, output_formatter, quantum=1, **kwargs):
+        super().__init__(processes, last_instant, output_formatter, **kwargs)
+        self.quantum = quantum
+        self.stride = array('q', [self.STRIDE1 // max(1, p.priority) for p in processes])
+        self.pass_value = array('q', [0]) * len(processes)
+        self.global_pass = 0
+
+    def queue_key(self, process):
+        """Smallest pass value first."""
+        return self.pass_value[process.pid]
+
+    def on_ready(self, process):
+        """Joining processes start at the global pass so they cannot monopolize the CPU."""
+        pid = process.pid
+        self.pass_value[pid] = max(self.pass_value[pid], self.global_pass)
+
+    def time_slice(self, process, current_time, next_event):
+        """Fixed quantum."""
+        return self.quantum
+
+    def charge(self, process, run_time):
+        """Advance pass by stride for each time unit used."""
+        pid = process.pid
+        self.global_pass = max(self.global_pass, self.pass_value[pid])
+        self.pass_value[pid] += self.stride[pid] * run_time
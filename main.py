@@ -4,9 +4,11 @@ CPU Scheduling Algorithms Simulator
 Main entry point for the scheduling simulation.
 """
 
+import argparse
 import sys
 from utils import InputParser, OutputFormatter
-from algorithms import (FCFS, RoundRobin, SPN, SRT, HRRN, FB1, FB2i, Aging)
+from algorithms import (FCFS, RoundRobin, SPN, SRT, HRRN, FB1, FB2i, Aging,
+                        CFS, EDF, Stride, ShardedScheduler, AdaptiveRoundRobin, AdaptiveAging)
 
 
 def get_algorithm_name(algo_id: str, quantum=None) -> str:
@@ -19,39 +21,99 @@ def get_algorithm_name(algo_id: str, quantum=None) -> str:
         '5': 'HRRN',
         '6': 'FB-1',
         '7': 'FB-2i',
-        '8': f'Aging' if not quantum else f'Aging-{quantum}'
+        '8': f'Aging' if not quantum else f'Aging-{quantum}',
+        '9': f'CFS-{quantum}' if quantum else 'CFS',
+        '10': 'EDF',
+        '11': f'Stride-{quantum}' if quantum else 'Stride'
     }
     return names.get(algo_id, f'Unknown-{algo_id}')
 
 
-def create_scheduler(algo_id: str, quantum, processes, last_instant, output_formatter):
-    """Factory function to create appropriate scheduler."""
+def get_scheduler_class(algo_id: str, quantum):
+    """
+    Return the scheduler class and its extra constructor arguments.
+    
+    An adaptive quantum ('aP', P = target percentile) selects the adaptive
+    variant of RR or Aging.
+    """
+    if isinstance(quantum, str):
+        adaptive = {'2': AdaptiveRoundRobin, '8': AdaptiveAging}.get(algo_id)
+        if adaptive is None:
+            raise ValueError(f"Algorithm {algo_id} has no adaptive quantum")
+        return adaptive, (int(quantum[1:]) / 100,)
     if algo_id == '1':
-        return FCFS(processes, last_instant, output_formatter)
+        return FCFS, ()
     elif algo_id == '2':
         if quantum is None:
             quantum = 1
-        return RoundRobin(processes, last_instant, output_formatter, quantum)
+        return RoundRobin, (quantum,)
     elif algo_id == '3':
-        return SPN(processes, last_instant, output_formatter)
+        return SPN, ()
     elif algo_id == '4':
-        return SRT(processes, last_instant, output_formatter)
+        return SRT, ()
     elif algo_id == '5':
-        return HRRN(processes, last_instant, output_formatter)
+        return HRRN, ()
     elif algo_id == '6':
-        return FB1(processes, last_instant, output_formatter)
+        return FB1, ()
     elif algo_id == '7':
-        return FB2i(processes, last_instant, output_formatter)
+        return FB2i, ()
     elif algo_id == '8':
         if quantum is None:
             quantum = 1
-        return Aging(processes, last_instant, output_formatter, quantum)
+        return Aging, (quantum,)
+    elif algo_id == '9':
+        if quantum is None:
+            quantum = 1
+        return CFS, (quantum,)
+    elif algo_id == '10':
+        return EDF, ()
+    elif algo_id == '11':
+        if quantum is None:
+            quantum = 1
+        return Stride, (quantum,)
     else:
         raise ValueError(f"Unknown algorithm ID: {algo_id}")
 
 
+def create_scheduler(algo_id: str, quantum, processes, last_instant, output_formatter,
+                     jobs=None, context_switch=0, dispatch_latency=0, index=None):
+    """
+    Factory function to create appropriate scheduler.
+    
+    If jobs is given, shardable algorithms run each busy period in a process
+    pool of that many workers (0 = all cores). Sharding is only exact when
+    switching is free and there is no I/O, so otherwise it is skipped.
+    index is the parser's WorkloadIndex, shared by every scheduler in the run.
+    """
+    scheduler_class, args = get_scheduler_class(algo_id, quantum)
+    free_switching = context_switch == 0 and dispatch_latency == 0
+    cpu_only = not any(p.has_io for p in processes)
+    if (jobs is not None and free_switching and cpu_only
+            and ShardedScheduler.can_shard(scheduler_class)):
+        return ShardedScheduler(processes, last_instant, output_formatter,
+                                scheduler_class, *args, workers=jobs or None, index=index)
+    return scheduler_class(processes, last_instant, output_formatter, *args,
+                           context_switch=context_switch, dispatch_latency=dispatch_latency,
+                           index=index)
+
+
+def parse_args(argv=None):
+    """Parse command line options."""
+    arg_parser = argparse.ArgumentParser(description="CPU scheduling algorithms simulator "
+                                                     "(reads the workload from stdin)")
+    arg_parser.add_argument('-j', '--jobs', type=int, default=None, metavar='N',
+                            help="simulate independent busy periods in parallel "
+                                 "using N worker processes (0 = all cores)")
+    arg_parser.add_argument('--context-switch', type=int, default=0, metavar='T',
+                            help="time lost switching from one job to another")
+    arg_parser.add_argument('--dispatch-latency', type=int, default=0, metavar='T',
+                            help="time lost every time a different job is dispatched")
+    return arg_parser.parse_args(argv)
+
+
 def main():
     """Main function."""
+    args = parse_args()
     try:
         # Parse input
         parser = InputParser()
@@ -66,14 +128,18 @@ def main():
             algo_name = get_algorithm_name(algo_id, quantum)
             try:
                 scheduler = create_scheduler(algo_id, quantum, parser.processes, 
-                                            parser.last_instant, output_formatter)
+                                            parser.last_instant, output_formatter,
+                                            jobs=args.jobs,
+                                            context_switch=args.context_switch,
+                                            dispatch_latency=args.dispatch_latency,
+                                            index=parser.index)
                 scheduler.run()
                 
                 # Display results
                 if parser.operation == 'trace':
                     output_formatter.print_trace(algo_name)
                 elif parser.operation == 'stats':
-                    output_formatter.print_stats(algo_name)
+                    output_formatter.print_stats(algo_name, scheduler.state)
                 
                 print()  # Blank line between algorithms
                 
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo policy comparison.
+Draws many seeded random workloads from a distribution spec, runs a set of
+scheduling algorithms on each in a process pool, and reports mean and tail
+turnaround per policy with confidence intervals.
+"""
+
+import argparse
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from statistics import NormalDist
+from typing import Dict, List, Optional, Tuple
+from utils import InputParser, OutputFormatter, WorkloadIndex
+from utils.generator import WorkloadDistribution
+from main import get_algorithm_name, get_scheduler_class
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def simulate_workload(task) -> Dict[str, Tuple[float, float]]:
+    """
+    Run every algorithm on one random workload (runs in a worker process).
+
+    Returns:
+        {algorithm name: (mean turnaround, tail turnaround)}
+    """
+    seed, distribution, algorithms, tail = task
+    processes, last_instant = distribution.generate(seed)
+    index = WorkloadIndex(processes)
+    results = {}
+    for algo_id, quantum in algorithms:
+        scheduler_class, args = get_scheduler_class(algo_id, quantum)
+        output = OutputFormatter(last_instant, processes)
+        scheduler = scheduler_class(processes, last_instant, output, *args, index=index)
+        scheduler.run()
+        turnaround = list(scheduler.state.turnaround_time)
+        results[get_algorithm_name(algo_id, quantum)] = (sum(turnaround) / len(turnaround),
+                                                         percentile(turnaround, tail))
+    return results
+
+
+def simulate_chunk(task) -> List[Dict[str, Tuple[float, float]]]:
+    """Run simulate_workload on a range of consecutive seeds (runs in a worker process)."""
+    first_seed, count, distribution, algorithms, tail = task
+    return [simulate_workload((first_seed + i, distribution, algorithms, tail)) for i in range(count)]
+
+
+class RunningStat:
+    """Running mean and variance (Welford's algorithm)."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, value: float):
+        """Add one observation."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    def half_width(self, z: float) -> float:
+        """Half width of the normal-approximation confidence interval of the mean."""
+        if self.count < 2:
+            return math.inf
+        return z * math.sqrt(self._m2 / (self.count - 1) / self.count)
+
+
+class PolicyComparison:
+    """
+    Accumulates per-policy turnaround statistics across workloads.
+    Every policy runs on the same workloads, so the per-workload differences
+    in mean turnaround between each pair of policies are tracked as well.
+
+    Early stopping tests those paired differences only at a few looks, after
+    min_runs, 2 * min_runs, 4 * min_runs, ... workloads. Look j uses error
+    rate alpha / 2**(j + 1), Bonferroni-split over all pairs of policies, so
+    over any number of looks the chance of stopping when the policies are in
+    fact equal stays below alpha = 1 - confidence.
+    """
+
+    def __init__(self, names: List[str], confidence: float = 0.95, min_runs: int = 30):
+        self.names = names
+        self.alpha = 1 - confidence
+        self.min_runs = max(2, min_runs)
+        self.z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        self.mean = {name: RunningStat() for name in names}
+        self.tail = {name: RunningStat() for name in names}
+        # (a, b) -> mean turnaround of a minus that of b, per workload
+        self.difference = {pair: RunningStat() for pair in combinations(names, 2)}
+        self.runs = 0
+
+    def add(self, result: Dict[str, Tuple[float, float]]):
+        """Record the result of one workload."""
+        self.runs += 1
+        for name, (mean_turnaround, tail_turnaround) in result.items():
+            self.mean[name].add(mean_turnaround)
+            self.tail[name].add(tail_turnaround)
+        for (a, b), stat in self.difference.items():
+            stat.add(result[a][0] - result[b][0])
+
+    def interval(self, name: str, tail: bool = False) -> Tuple[float, float]:
+        """(low, high) confidence interval of a policy's mean or tail turnaround."""
+        stat = (self.tail if tail else self.mean)[name]
+        half = stat.half_width(self.z)
+        return stat.mean - half, stat.mean + half
+
+    def paired_interval(self, name: str, baseline: str, z: Optional[float] = None) -> Tuple[float, float]:
+        """(low, high) confidence interval of name's mean turnaround minus baseline's."""
+        if (name, baseline) in self.difference:
+            stat, sign = self.difference[(name, baseline)], 1
+        else:
+            stat, sign = self.difference[(baseline, name)], -1
+        half = stat.half_width(self.z if z is None else z)
+        return sign * stat.mean - half, sign * stat.mean + half
+
+    def look(self) -> Optional[int]:
+        """Index j of the current look (runs == min_runs * 2**j), or None between looks."""
+        ratio, rest = divmod(self.runs, self.min_runs)
+        if rest or ratio == 0 or ratio & (ratio - 1):
+            return None
+        return ratio.bit_length() - 1
+
+    def look_z(self, look: int) -> float:
+        """
+        Critical value of a look: its share of alpha, split over all pairs of
+        policies, as a Student t quantile (Cornish-Fisher expansion) since the
+        variance is estimated from the same runs.
+        """
+        pairs = max(1, len(self.difference))
+        z = NormalDist().inv_cdf(1 - self.alpha / 2 ** (look + 1) / pairs / 2)
+        df = self.runs - 1
+        return (z + (z ** 3 + z) / (4 * df)
+                + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * df ** 2))
+
+    def separated(self) -> bool:
+        """Whether, at a look, the best policy is significantly better than every other one."""
+        look = self.look()
+        if look is None or len(self.names) < 2:
+            return False
+        z = self.look_z(look)
+        best = min(self.names, key=lambda name: self.mean[name].mean)
+        return all(self.paired_interval(name, best, z)[0] > 0 for name in self.names if name != best)
+
+    def progress_line(self) -> str:
+        """One-line summary for streaming output."""
+        parts = [f"{name} {self.mean[name].mean:.2f}±{self.mean[name].half_width(self.z):.2f}"
+                 for name in self.names]
+        return f"runs={self.runs:<6} " + "  ".join(parts)
+
+    def print_table(self, tail: float):
+        """Print the final comparison table."""
+        tail_label = f"P{round(tail * 100)}"
+        print(f"{'Policy':10}{'Runs':>7}{'MeanTurn':>10}{'±CI':>8}{tail_label + 'Turn':>10}{'±CI':>8}")
+        for name in sorted(self.names, key=lambda n: self.mean[n].mean):
+            print(f"{name:10}{self.mean[name].count:7}"
+                  f"{self.mean[name].mean:10.2f}{self.mean[name].half_width(self.z):8.2f}"
+                  f"{self.tail[name].mean:10.2f}{self.tail[name].half_width(self.z):8.2f}")
+
+
+def compare_policies(distribution: WorkloadDistribution, algorithms, runs: int, seed: int = 0,
+                     workers=None, confidence: float = 0.95, tail: float = 0.95,
+                     early_stop: bool = False, min_runs: int = 30, report_every: int = 0,
+                     stream=sys.stdout) -> PolicyComparison:
+    """
+    Run the Monte Carlo comparison.
+
+    Args:
+        distribution: Workload distribution to draw from
+        algorithms: List of (algorithm_id, quantum) tuples, as parsed from the input
+        runs: Maximum number of workloads
+        seed: Seed of the first workload (workload i uses seed + i)
+        workers: Number of worker processes (None = all cores, 1 = in process)
+        confidence: Confidence level of the reported intervals
+        tail: Percentile used as tail turnaround (e.g. 0.95)
+        early_stop: Stop once the best policy's paired difference to every other
+            policy is significant at a look (see PolicyComparison)
+        min_runs: Workloads before the first early-stopping look
+        report_every: Print a progress line every N finished workloads (0 = never)
+        stream: Where progress lines go
+
+    Returns:
+        The accumulated PolicyComparison
+    """
+    if not 0 < confidence < 1:
+        raise ValueError(f"Confidence must be between 0 and 1: {confidence}")
+    if not 0 < tail <= 1:
+        raise ValueError(f"Tail percentile must be in (0, 1]: {tail}")
+    names = [get_algorithm_name(algo_id, quantum) for algo_id, quantum in algorithms]
+    comparison = PolicyComparison(names, confidence, min_runs)
+
+    def record(result):
+        comparison.add(result)
+        if report_every and comparison.runs % report_every == 0:
+            print(comparison.progress_line(), file=stream, flush=True)
+        return early_stop and comparison.separated()
+
+    if workers == 1:
+        for i in range(runs):
+            if record(simulate_workload((seed + i, distribution, algorithms, tail))):
+                break
+        return comparison
+
+    workers = workers or os.cpu_count() or 1
+    # Each task covers a chunk of consecutive seeds so IPC is small next to the work
+    chunk = max(1, min(64, runs // (workers * 8)))
+    chunks = [(seed + start, min(chunk, runs - start), distribution, algorithms, tail)
+              for start in range(0, runs, chunk)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Results are recorded in seed order, so the table and the early-stop
+        # decision do not depend on worker timing. A bounded window of chunks
+        # in flight keeps the work wasted by early stopping small.
+        window = workers * 2
+        futures = {}
+        submitted = 0
+        stop = False
+        for index in range(len(chunks)):
+            while submitted < len(chunks) and submitted - index < window:
+                futures[submitted] = executor.submit(simulate_chunk, chunks[submitted])
+                submitted += 1
+            for result in futures.pop(index).result():
+                if record(result):
+                    stop = True
+                    break
+            if stop:
+                break
+        for future in futures.values():
+            future.cancel()
+    return comparison
+
+
+def parse_args(argv=None):
+    """Parse command line options."""
+    arg_parser = argparse.ArgumentParser(description="Compare scheduling policies on random workloads")
+    arg_parser.add_argument('algorithms',
+                            help="comma-separated algorithm list, as on line 2 of an input file")
+    arg_parser.add_argument('--spec', default='',
+                            help="workload distribution, e.g. "
+                                 "'processes=20,interarrival=exp:3,service=uniform:1:8'")
+    arg_parser.add_argument('-n', '--runs', type=int, default=1000, help="maximum number of workloads")
+    arg_parser.add_argument('--seed', type=int, default=0, help="seed of the first workload")
+    arg_parser.add_argument('-j', '--jobs', type=int, default=0, metavar='N',
+                            help="worker processes (0 = all cores, 1 = no pool)")
+    arg_parser.add_argument('--confidence', type=float, default=0.95, help="confidence level")
+    arg_parser.add_argument('--tail', type=float, default=0.95, help="tail turnaround percentile")
+    arg_parser.add_argument('--early-stop', action='store_true',
+                            help="stop once the best policy is significantly better than "
+                                 "each other one on the same workloads")
+    arg_parser.add_argument('--min-runs', type=int, default=30,
+                            help="workloads before the first early-stopping look "
+                                 "(later looks at 2x, 4x, ...)")
+    arg_parser.add_argument('--report-every', type=int, default=100, metavar='N',
+                            help="print progress every N workloads (0 = never)")
+    return arg_parser.parse_args(argv)
+
+
+def main():
+    """Main function."""
+    args = parse_args()
+    try:
+        algorithms = InputParser.parse_algorithm_list(args.algorithms)
+        distribution = WorkloadDistribution(args.spec)
+        comparison = compare_policies(distribution, algorithms, args.runs, seed=args.seed,
+                                      workers=args.jobs or None, confidence=args.confidence,
+                                      tail=args.tail, early_stop=args.early_stop,
+                                      min_runs=args.min_runs, report_every=args.report_every)
+        comparison.print_table(args.tail)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
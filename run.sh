@@ -25,6 +25,14 @@ fi
 PROJECT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 TESTCASES_DIR="$PROJECT_DIR/testcases"
 
+# Extra command line options for a test case, read from its NNx-args.txt file if present
+test_args() {
+    local args_file="${1%-input.txt}-args.txt"
+    if [ -f "$args_file" ]; then
+        cat "$args_file"
+    fi
+}
+
 # Function to run a single test case
 run_test() {
     local input_file=$1
@@ -35,7 +43,7 @@ run_test() {
     echo -e "${CYAN}========================================${NC}"
     
     if [ -f "$input_file" ]; then
-        python3 "$PROJECT_DIR/main.py" < "$input_file"
+        python3 "$PROJECT_DIR/main.py" $(test_args "$input_file") < "$input_file"
         echo ""
     else
         echo -e "${RED}Error: File not found: $input_file${NC}"
@@ -71,7 +79,7 @@ compare_output() {
     echo -e "${CYAN}Comparing with expected output...${NC}"
     
     local temp_output=$(mktemp)
-    python3 "$PROJECT_DIR/main.py" < "$input_file" > "$temp_output"
+    python3 "$PROJECT_DIR/main.py" $(test_args "$input_file") < "$input_file" > "$temp_output"
     
     if diff -q "$temp_output" "$output_file" > /dev/null; then
         echo -e "${GREEN}✓ Output matches expected result${NC}"
@@ -115,10 +123,14 @@ list_testcases() {
             # Read first few lines to show what's being tested
             local mode=$(sed -n '1p' "$input_file")
             local algos=$(sed -n '2p' "$input_file")
+            local args=$(test_args "$input_file")
             
             echo -e "${YELLOW}$filename${NC}"
             echo "  Mode: $mode"
             echo "  Algorithms: $algos"
+            if [ -n "$args" ]; then
+                echo "  Options: $args"
+            fi
             echo ""
         fi
     done
@@ -2,8 +2,10 @@
 Utility modules for CPU scheduling simulation.
 """
 
-from .process import Process
+from .process import ProcessSpec, RunState
 from .parser import InputParser
 from .output import OutputFormatter
+from .workload import ArrivalCursor, WorkloadIndex
 
-__all__ = ['Process', 'InputParser', 'OutputFormatter']
+__all__ = ['ProcessSpec', 'RunState', 'InputParser', 'OutputFormatter',
+           'ArrivalCursor', 'WorkloadIndex']
@@ -0,0 +1,118 @@
+"""
+Random workload generation from a distribution spec.
+"""
+
+import random
+from typing import Dict, List, Tuple
+from .process import ProcessSpec
+
+
+class Distribution:
+    """
+    An integer-valued random distribution parsed from a short spec.
+
+    Supported specs:
+        const:V         always V
+        uniform:A:B     uniform integer in [A, B]
+        exp:MEAN        exponential with the given mean, rounded
+        choice:A:B:...  one of the listed values
+    """
+
+    KINDS = ('const', 'uniform', 'exp', 'choice')
+
+    def __init__(self, spec: str, minimum: int = 0):
+        """
+        Parse a distribution spec.
+
+        Args:
+            spec: Distribution spec (see class docstring)
+            minimum: Smallest value ever returned
+        """
+        parts = spec.strip().split(':')
+        self.kind = parts[0]
+        if self.kind not in self.KINDS:
+            raise ValueError(f"Unknown distribution: {spec}")
+        try:
+            self.params = [float(p) for p in parts[1:]]
+        except ValueError:
+            raise ValueError(f"Invalid distribution parameters: {spec}")
+        expected = {'const': 1, 'uniform': 2, 'exp': 1}.get(self.kind)
+        if (expected is not None and len(self.params) != expected) or not self.params:
+            raise ValueError(f"Wrong number of parameters for distribution: {spec}")
+        self.spec = spec
+        self.minimum = minimum
+
+    def sample(self, rng: random.Random) -> int:
+        """Draw one value."""
+        if self.kind == 'const':
+            value = self.params[0]
+        elif self.kind == 'uniform':
+            value = rng.randint(int(self.params[0]), int(self.params[1]))
+        elif self.kind == 'exp':
+            value = round(rng.expovariate(1.0 / self.params[0])) if self.params[0] > 0 else 0
+        else:
+            value = rng.choice(self.params)
+        return max(self.minimum, int(value))
+
+    def __repr__(self):
+        return f"Distribution({self.spec})"
+
+
+class WorkloadDistribution:
+    """
+    Distribution of random workloads, parsed from a comma-separated spec such as
+    ``processes=20,interarrival=exp:3,service=uniform:1:8``.
+
+    Keys:
+        processes       number of processes per workload (default 10)
+        interarrival    distribution of the gap between arrivals (default exp:2)
+        service         distribution of service times (default uniform:1:8)
+        priority        distribution of priorities (default: equal to service,
+                        as in the input format)
+    """
+
+    DEFAULTS = {'processes': '10', 'interarrival': 'exp:2', 'service': 'uniform:1:8'}
+
+    def __init__(self, spec: str = ''):
+        fields: Dict[str, str] = dict(self.DEFAULTS)
+        for item in filter(None, (s.strip() for s in spec.split(','))):
+            if '=' not in item:
+                raise ValueError(f"Invalid workload spec entry: {item}")
+            key, value = (s.strip() for s in item.split('=', 1))
+            if key not in ('processes', 'interarrival', 'service', 'priority'):
+                raise ValueError(f"Unknown workload spec key: {key}")
+            fields[key] = value
+        self.spec = spec
+        self.process_count = int(fields['processes'])
+        if self.process_count < 1:
+            raise ValueError("Workload spec needs at least one process")
+        self.interarrival = Distribution(fields['interarrival'], minimum=0)
+        self.service = Distribution(fields['service'], minimum=1)
+        self.priority = Distribution(fields['priority']) if 'priority' in fields else None
+
+    def generate(self, seed: int) -> Tuple[List[ProcessSpec], int]:
+        """
+        Draw one workload.
+
+        Args:
+            seed: Random seed; the same seed always gives the same workload
+
+        Returns:
+            (processes, last_instant), where last_instant is late enough for
+            every process to finish under any work-conserving policy
+        """
+        rng = random.Random(seed)
+        processes = []
+        arrival_time = 0
+        busy_until = 0
+        for pid in range(self.process_count):
+            if pid:
+                arrival_time += self.interarrival.sample(rng)
+            service_time = self.service.sample(rng)
+            priority = self.priority.sample(rng) if self.priority else service_time
+            processes.append(ProcessSpec(pid, f"P{pid}", arrival_time, service_time, priority))
+            busy_until = max(busy_until, arrival_time) + service_time
+        return processes, busy_until + 1
+
+    def __repr__(self):
+        return f"WorkloadDistribution({self.spec!r})"
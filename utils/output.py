@@ -3,13 +3,13 @@ Output formatter for displaying scheduling results.
 """
 
 from typing import List, Dict
-from .process import Process
+from .process import ProcessSpec, RunState
 
 
 class OutputFormatter:
     """Handles formatting and displaying of scheduling results."""
     
-    def __init__(self, last_instant: int, processes: List[Process]):
+    def __init__(self, last_instant: int, processes: List[ProcessSpec]):
         self.last_instant = last_instant
         self.processes = processes
         self.timeline = {}  # {process_name: [state_at_time_0, state_at_time_1, ...]}
@@ -29,6 +29,16 @@ class OutputFormatter:
         if 0 <= time < self.last_instant:
             self.timeline[process_name][time] = '*'
     
+    def mark_switching(self, process_name: str, time: int):
+        """Mark a process as being switched in (context switch / dispatch) at a given time."""
+        if 0 <= time < self.last_instant:
+            self.timeline[process_name][time] = 'x'
+    
+    def mark_blocked(self, process_name: str, time: int):
+        """Mark a process as blocked on I/O at a given time."""
+        if 0 <= time < self.last_instant:
+            self.timeline[process_name][time] = 'o'
+    
     def mark_waiting(self, process_name: str, time: int):
         """Mark a process as waiting at a given time."""
         if 0 <= time < self.last_instant:
@@ -36,6 +46,12 @@ class OutputFormatter:
             if self.timeline[process_name][time] == ' ':
                 self.timeline[process_name][time] = '.'
     
+    def merge_timeline(self, timeline: Dict[str, List[str]], start: int = 0):
+        """Copy timeline rows produced by another formatter into this one, from time start on."""
+        for process_name, row in timeline.items():
+            if row:
+                self.timeline[process_name][start:start + len(row)] = row
+    
     def print_trace(self, algorithm_name: str):
         """Print timeline in trace format."""
         # Print header with time units
@@ -57,8 +73,8 @@ class OutputFormatter:
         # Print separator
         print("-" * (6 + self.last_instant * 2 + 1))
     
-    def print_stats(self, algorithm_name: str):
-        """Print statistics table."""
+    def print_stats(self, algorithm_name: str, state: RunState):
+        """Print statistics table for a completed run."""
         print(f"{algorithm_name:12}", end="")
         for process in self.processes:
             print(f"{process.name:5}", end="")
@@ -79,17 +95,48 @@ class OutputFormatter:
         # Finish times
         print(f"{'Finish':12}", end="")
         for process in self.processes:
-            print(f"{process.finish_time:5}", end="")
+            print(f"{state.finish_time[process.pid]:5}", end="")
         print()
         
         # Turnaround times
         print(f"{'Turnaround':12}", end="")
         for process in self.processes:
-            print(f"{process.turnaround_time:5}", end="")
+            print(f"{state.turnaround_time[process.pid]:5}", end="")
         print()
         
         # Normalized turnaround
         print(f"{'NormTurn':12}", end="")
         for process in self.processes:
-            print(f"{process.normalized_turnaround:5.2f}", end="")
+            print(f"{state.normalized_turnaround[process.pid]:5.2f}", end="")
         print()
+        
+        # Deadlines (only shown when the workload has any)
+        if any(process.deadline is not None for process in self.processes):
+            print(f"{'Deadline':12}", end="")
+            for process in self.processes:
+                deadline = '-' if process.deadline is None else process.deadline
+                print(f"{deadline:>5}", end="")
+            print()
+            print(f"{'Lateness':12}", end="")
+            for process in self.processes:
+                if process.deadline is None:
+                    print(f"{'-':>5}", end="")
+                else:
+                    print(f"{state.finish_time[process.pid] - process.deadline:5}", end="")
+            print()
+        
+        # Switching overhead (only shown when switches cost time)
+        if state.switch_time:
+            print(f"{'Switches':12}{state.switch_count:5}")
+            print(f"{'LostCPU':12}{state.switch_time:5}")
+        
+        # Quantum changes as quantum@time (only shown for adaptive schedulers)
+        if state.quantum_trajectory:
+            changes = ' '.join(f"{quantum}@{time}" for time, quantum in state.quantum_trajectory)
+            print(f"{'Quantum':12}{changes}")
+        
+        # Utilization (only shown for workloads with I/O bursts)
+        if state.device_utilization:
+            print(f"{'CPU util':12}{state.cpu_utilization:5.2f}")
+            for device_name, utilization in sorted(state.device_utilization.items()):
+                print(f"{device_name + ' util':12}{utilization:5.2f}")
@@ -3,19 +3,24 @@ Input parser for reading and parsing scheduling simulation input.
 """
 
 import sys
-from typing import List, Tuple
-from .process import Process
+from typing import List, Optional, Tuple, Union
+from .process import ProcessSpec
+from .workload import WorkloadIndex
 
 
 class InputParser:
     """Handles parsing of input data for scheduling simulation."""
     
+    DEFAULT_IO_DEVICE = 'io'
+    DEFAULT_ADAPTIVE_PERCENTILE = 80
+    
     def __init__(self):
         self.operation = ""  # "trace" or "stats"
         self.algorithms = []  # List of (algorithm_id, quantum) tuples
         self.last_instant = 0
         self.process_count = 0
         self.processes = []
+        self.index = None  # WorkloadIndex shared by every scheduler in the run
     
     def parse_from_stdin(self):
         """Parse input from standard input."""
@@ -52,44 +57,96 @@ class InputParser:
             raise ValueError("Invalid input: not enough process definitions")
         
         self._parse_processes(lines[4:4 + self.process_count])
+        self.index = WorkloadIndex(self.processes)
     
     def _parse_algorithms(self, algorithm_line: str):
         """Parse algorithm specifications."""
-        self.algorithms = []
+        self.algorithms = self.parse_algorithm_list(algorithm_line)
+    
+    @staticmethod
+    def parse_algorithm_list(algorithm_line: str) -> List[Tuple[str, Optional[Union[int, str]]]]:
+        """
+        Parse a comma-separated algorithm list into (algorithm_id, quantum) tuples.
+        
+        The quantum is an int, or for an adaptive quantum a string 'aP' where P
+        is the target percentile (e.g. "2-a90"; "2-a" means "2-a80").
+        """
+        algorithms = []
         for algo_str in algorithm_line.split(','):
             algo_str = algo_str.strip()
             if '-' in algo_str:
                 # Algorithm with quantum (e.g., "2-4" for RR with q=4)
                 algo_id, quantum_str = algo_str.split('-')
-                self.algorithms.append((algo_id, int(quantum_str)))
+                if quantum_str.startswith('a'):
+                    percentile = quantum_str[1:] or str(InputParser.DEFAULT_ADAPTIVE_PERCENTILE)
+                    if not percentile.isdigit() or not 1 <= int(percentile) <= 100:
+                        raise ValueError(f"Invalid adaptive quantum: {algo_str}")
+                    algorithms.append((algo_id, f"a{int(percentile)}"))
+                else:
+                    algorithms.append((algo_id, int(quantum_str)))
             else:
                 # Algorithm without quantum
-                self.algorithms.append((algo_str, None))
+                algorithms.append((algo_str, None))
+        return algorithms
     
     def _parse_processes(self, process_lines: List[str]):
         """Parse process definitions."""
         self.processes = []
-        for line in process_lines:
+        for pid, line in enumerate(process_lines):
             parts = [p.strip() for p in line.split(',')]
             if len(parts) < 3:
                 raise ValueError(f"Invalid process definition: {line}")
             
             name = parts[0]
             arrival_time = int(parts[1])
-            service_or_priority = int(parts[2])
+            cpu_bursts, io_bursts = self._parse_bursts(parts[2], line)
+            service_or_priority = sum(cpu_bursts)
+            # Optional fourth field: absolute deadline (used by EDF)
+            deadline = int(parts[3]) if len(parts) > 3 and parts[3] else None
             
             # For Aging algorithm (8), third field is priority
             # For others, it's service time
             # We'll handle this distinction in the algorithm itself
-            process = Process(
+            process = ProcessSpec(
+                pid=pid,
                 name=name,
                 arrival_time=arrival_time,
                 service_time=service_or_priority,
-                priority=service_or_priority  # Will be used only for Aging
+                priority=service_or_priority,  # Will be used only for Aging
+                cpu_bursts=cpu_bursts,
+                io_bursts=io_bursts,
+                deadline=deadline
             )
             self.processes.append(process)
     
-    def get_process_by_name(self, name: str) -> Process:
+    def _parse_bursts(self, burst_field: str, line: str) -> Tuple[Tuple[int, ...], Tuple[Tuple[str, int], ...]]:
+        """
+        Parse a service field into CPU and I/O bursts.
+        
+        The field is either a single service time ("5") or alternating CPU and
+        I/O bursts separated by colons ("3:2:4"). An I/O burst may name its
+        device ("3:2@disk:4"); otherwise the default device is used.
+        """
+        fields = [f.strip() for f in burst_field.split(':')]
+        if len(fields) % 2 == 0:
+            raise ValueError(f"Invalid process definition (bursts must start and end with CPU): {line}")
+        
+        cpu_bursts = tuple(int(f) for f in fields[0::2])
+        io_bursts = []
+        for field in fields[1::2]:
+            if '@' in field:
+                length, device = field.split('@', 1)
+            else:
+                length, device = field, self.DEFAULT_IO_DEVICE
+            io_bursts.append((device.strip(), int(length)))
+        
+        # A lone service time may be 0; every burst of a sequence needs time
+        shortest = 1 if io_bursts else 0
+        if min(cpu_bursts) < shortest or any(length < 1 for _, length in io_bursts):
+            raise ValueError(f"Invalid process definition (invalid burst length): {line}")
+        return cpu_bursts, tuple(io_bursts)
+    
+    def get_process_by_name(self, name: str) -> ProcessSpec:
         """Get a process by its name."""
         for process in self.processes:
             if process.name == name:
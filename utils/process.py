@@ -1,55 +1,142 @@
 """
-Process class to represent a single process in the scheduling simulation.
+Process specification and per-run state for the scheduling simulation.
+
+A parsed workload is a sequence of immutable ``ProcessSpec`` objects that can be
+shared read-only between schedulers, threads and worker processes. Everything a
+scheduler mutates while it runs lives in a ``RunState``, which holds compact
+arrays indexed by process id.
 """
 
-from dataclasses import dataclass
-from typing import Optional
-
-
-@dataclass
-class Process:
-    """Represents a single process with all its attributes."""
-    
-    name: str
-    arrival_time: int
-    service_time: int
-    priority: int = 0  # Used for Aging algorithm
-    
-    # Calculated during scheduling
-    finish_time: int = 0
-    turnaround_time: int = 0
-    normalized_turnaround: float = 0.0
-    
-    # Runtime state
-    remaining_time: int = 0
-    start_time: Optional[int] = None
-    wait_time: int = 0
-    
-    def __post_init__(self):
-        """Initialize remaining time after creation."""
-        self.remaining_time = self.service_time
-    
-    def reset(self):
-        """Reset process state for a new scheduling run."""
-        self.remaining_time = self.service_time
-        self.finish_time = 0
-        self.turnaround_time = 0
-        self.normalized_turnaround = 0.0
-        self.start_time = None
-        self.wait_time = 0
-    
-    def calculate_stats(self):
-        """Calculate turnaround time and normalized turnaround."""
-        self.turnaround_time = self.finish_time - self.arrival_time
-        if self.service_time > 0:
-            self.normalized_turnaround = self.turnaround_time / self.service_time
-        else:
-            self.normalized_turnaround = 0.0
-    
+from array import array
+from typing import Optional, Sequence, Tuple
+
+
+class ProcessSpec:
+    """Immutable description of a single process in a workload."""
+
+    __slots__ = ('pid', 'name', 'arrival_time', 'service_time', 'priority',
+                 'cpu_bursts', 'io_bursts', 'deadline')
+
+    def __init__(self, pid: int, name: str, arrival_time: int, service_time: int,
+                 priority: int = 0, cpu_bursts: Optional[Tuple[int, ...]] = None,
+                 io_bursts: Tuple[Tuple[str, int], ...] = (), deadline: Optional[int] = None):
+        """
+        Create a process specification.
+
+        Args:
+            pid: Index of the process in its workload (used to index run state)
+            name: Display name of the process
+            arrival_time: Time at which the process arrives
+            service_time: Total CPU time the process needs
+            priority: Initial priority (used for Aging algorithm)
+            cpu_bursts: CPU burst lengths (defaults to a single burst of service_time)
+            io_bursts: (device, length) I/O bursts, one between each pair of CPU bursts
+            deadline: Absolute completion deadline (used for EDF), or None
+        """
+        if cpu_bursts is None:
+            cpu_bursts = (service_time,)
+        if len(io_bursts) != len(cpu_bursts) - 1:
+            raise ValueError(f"Process {name}: CPU and I/O bursts must alternate")
+        object.__setattr__(self, 'pid', pid)
+        object.__setattr__(self, 'name', name)
+        object.__setattr__(self, 'arrival_time', arrival_time)
+        object.__setattr__(self, 'service_time', service_time)
+        object.__setattr__(self, 'priority', priority)
+        object.__setattr__(self, 'cpu_bursts', tuple(cpu_bursts))
+        object.__setattr__(self, 'io_bursts', tuple(io_bursts))
+        object.__setattr__(self, 'deadline', deadline)
+
+    @property
+    def has_io(self) -> bool:
+        """Whether the process blocks on I/O between CPU bursts."""
+        return bool(self.io_bursts)
+
+    def with_pid(self, pid: int) -> 'ProcessSpec':
+        """Return a copy of this spec with a different process id."""
+        return ProcessSpec(pid, self.name, self.arrival_time, self.service_time,
+                           self.priority, self.cpu_bursts, self.io_bursts, self.deadline)
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, key):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __reduce__(self):
+        """Pickle support (slots plus blocked __setattr__ need explicit args)."""
+        return (self.__class__, self._key())
+
+    def _key(self):
+        return (self.pid, self.name, self.arrival_time, self.service_time, self.priority,
+                self.cpu_bursts, self.io_bursts, self.deadline)
+
+    def __eq__(self, other):
+        if not isinstance(other, ProcessSpec):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
     def __repr__(self):
-        return (f"Process({self.name}, arrival={self.arrival_time}, "
-                f"service={self.service_time}, remaining={self.remaining_time})")
-    
+        return (f"ProcessSpec({self.name}, pid={self.pid}, arrival={self.arrival_time}, "
+                f"service={self.service_time})")
+
     def __lt__(self, other):
         """For sorting/priority queue comparisons."""
         return self.arrival_time < other.arrival_time
+
+
+class RunState:
+    """Mutable state of one scheduling run, stored as arrays indexed by pid."""
+
+    __slots__ = ('remaining_time', 'ready_time', 'burst_index', 'finish_time', 'turnaround_time',
+                 'normalized_turnaround', 'switch_count', 'switch_time', 'cpu_utilization',
+                 'device_utilization', 'quantum_trajectory')
+
+    def __init__(self, processes: Sequence[ProcessSpec]):
+        """
+        Initialize run state for a workload.
+
+        Args:
+            processes: Process specifications, where processes[i].pid == i
+        """
+        count = len(processes)
+        # Remaining time of the current CPU burst
+        self.remaining_time = array('q', [p.cpu_bursts[0] for p in processes])
+        # Time at which the current CPU burst becomes ready (arrival or I/O completion)
+        self.ready_time = array('q', [p.arrival_time for p in processes])
+        self.burst_index = array('q', [0]) * count
+        self.finish_time = array('q', [0]) * count
+        self.turnaround_time = array('q', [0]) * count
+        self.normalized_turnaround = array('d', [0.0]) * count
+        # Number of times the running job changed, and CPU time lost doing so
+        self.switch_count = 0
+        self.switch_time = 0
+        # Fraction of the run the CPU / each I/O device was busy
+        self.cpu_utilization = 0.0
+        self.device_utilization = {}
+        # (time, quantum) at every quantum change of an adaptive scheduler
+        self.quantum_trajectory = []
+
+    def calculate_stats(self, processes: Sequence[ProcessSpec]):
+        """Calculate turnaround time and normalized turnaround for every process."""
+        for process in processes:
+            pid = process.pid
+            turnaround = self.finish_time[pid] - process.arrival_time
+            self.turnaround_time[pid] = turnaround
+            if process.service_time > 0:
+                self.normalized_turnaround[pid] = turnaround / process.service_time
+            else:
+                self.normalized_turnaround[pid] = 0.0
+
+    def cpu_time_used(self, process: ProcessSpec) -> int:
+        """CPU time a process has received so far."""
+        index = self.burst_index[process.pid]
+        used = sum(process.cpu_bursts[:index])
+        if index < len(process.cpu_bursts):
+            used += process.cpu_bursts[index] - self.remaining_time[process.pid]
+        return used
+
+    def __repr__(self):
+        return f"RunState(processes={len(self.remaining_time)})"
@@ -0,0 +1,106 @@
+"""
+Workload analysis helpers.
+
+``WorkloadIndex`` is built once per parsed workload (by ``InputParser``) and
+shared read-only by every scheduler in a run, so arrival ordering and work
+totals are computed once instead of once per algorithm.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Sequence, Tuple
+from .process import ProcessSpec
+
+
+class WorkloadIndex:
+    """Precomputed arrival order and work summary of a workload."""
+
+    __slots__ = ('order', 'arrival_times', 'service_prefix', 'total_work')
+
+    def __init__(self, processes: Sequence[ProcessSpec]):
+        """
+        Build the index.
+
+        Args:
+            processes: Process specs of the workload, where processes[i].pid == i
+        """
+        # Arrival order; ties keep the workload's own order
+        order = sorted(processes, key=lambda p: (p.arrival_time, p.pid))
+        self.order: Tuple[ProcessSpec, ...] = tuple(order)
+        self.arrival_times = array('q', [p.arrival_time for p in order])
+
+        # service_prefix[i] = total service time of the first i arrivals
+        prefix = array('q', [0])
+        for process in order:
+            prefix.append(prefix[-1] + process.service_time)
+        self.service_prefix = prefix
+        self.total_work = prefix[-1]
+
+    def cursor(self) -> 'ArrivalCursor':
+        """Return a new cursor over arrivals, positioned before the first one."""
+        return ArrivalCursor(self)
+
+    def busy_periods(self) -> List[List[ProcessSpec]]:
+        """
+        Split the workload into independent busy periods.
+
+        Under any work-conserving policy the CPU only idles when no work is
+        pending, so the idle points depend on arrivals and service times alone.
+        A busy period ends when all work that arrived so far is done before the
+        next arrival; nothing scheduled before that point can affect what comes
+        after it.
+
+        Returns:
+            List of busy periods, each a list of specs in their original order
+        """
+        periods = []
+        start = 0
+        prefix = self.service_prefix
+        for i, process in enumerate(self.order):
+            # The CPU never idles inside a period, so it ends at its first
+            # arrival plus the service time of everything admitted so far
+            busy_until = self.order[start].arrival_time + prefix[i] - prefix[start]
+            if i > start and process.arrival_time >= busy_until:
+                periods.append(sorted(self.order[start:i], key=lambda p: p.pid))
+                start = i
+        if start < len(self.order):
+            periods.append(sorted(self.order[start:], key=lambda p: p.pid))
+        return periods
+
+    def __repr__(self):
+        return f"WorkloadIndex(processes={len(self.order)}, total_work={self.total_work})"
+
+
+class ArrivalCursor:
+    """Per-run position in a WorkloadIndex's arrival order."""
+
+    __slots__ = ('index', 'position')
+
+    def __init__(self, index: WorkloadIndex):
+        self.index = index
+        self.position = 0
+
+    def advance(self, time: int, inclusive: bool = True) -> Tuple[ProcessSpec, ...]:
+        """
+        Move past every process arriving by a given time and return them.
+
+        Args:
+            time: Current simulation time
+            inclusive: Whether processes arriving exactly at time are included
+        """
+        find = bisect_right if inclusive else bisect_left
+        end = find(self.index.arrival_times, time, self.position)
+        admitted = self.index.order[self.position:end]
+        self.position = end
+        return admitted
+
+    def arrived_by(self, time: int) -> Tuple[ProcessSpec, ...]:
+        """Processes arriving by a given time that the cursor has not moved past yet."""
+        end = bisect_right(self.index.arrival_times, time, self.position)
+        return self.index.order[self.position:end]
+
+    def peek(self) -> Optional[int]:
+        """Arrival time of the next process, or None if all have arrived."""
+        if self.position < len(self.index.order):
+            return self.index.arrival_times[self.position]
+        return None